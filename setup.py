@@ -32,8 +32,10 @@ setup(
     },
     install_requires=[
         "pandas>=2.0.0",
+        "numpy>=1.22.4",
         "PyQt6>=6.5.0",
         "openpyxl>=3.1.2",
+        "pyyaml>=6.0",
     ],
     entry_points={
         "console_scripts": [
@@ -27,6 +27,7 @@ def main():
     parser.add_argument('--output', '-o', help="The path to the output JSON file", nargs='?', const=None, type=str)
     parser.add_argument('--datatypes', '-d', help="File with datatypes in python object format", nargs='?', const=None, type=str)
     parser.add_argument('--skiprows', '-s', help="Number of rows to skip from the beginning of the file", type=int, default=0)
+    parser.add_argument('--engine', '-e', help="CSV parser engine (pyarrow requires the pyarrow package)", choices=['c', 'pyarrow'], default='c')
     parser.add_argument('--debug', '-v', action='store_true', help="Print output to stdout")
     parser.add_argument(
         '--remove-nulls', '-n',
@@ -86,7 +87,8 @@ def main():
             output_file,
             args.remove_nulls,
             datatypes_file,
-            args.skiprows
+            args.skiprows,
+            args.engine
         )
     else:
         print(f"Error: Unsupported file format: {input_path.suffix}")
@@ -1,15 +1,25 @@
 """
 Core conversion functionality for CSV to JSON.
+
+pandas is imported by the functions that need it, so loading datatypes
+does not pay for the pandas import.
 """
 
 import json
 import io
 import os
-import pandas as pd
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
 from src.csv2json.core.logging import logger
+from src.csv2json.core.file_service import EXCEL_ENGINE
+
+# Use the libyaml based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER
 
 
 def unflatten_dic(dic):
@@ -28,16 +38,22 @@ def unflatten_dic(dic):
             del (dic[k])
 
 
-def merge_lists(dic, remove_nulls):
+def merge_lists(dic, remove_nulls, isnull=None):
     """
     Process dictionary to handle lists and null values.
 
     Args:
         dic (dict): Dictionary to process
         remove_nulls (bool): Whether to remove null values
+        isnull (callable, optional): Null check, pandas.isnull if None. Passed in
+            by the converters so pandas is not looked up for every record.
     """
+    if isnull is None:
+        import pandas as pd
+        isnull = pd.isnull
+
     for k, v in list(dic.items()):
-        if pd.isnull(v):
+        if isnull(v):
             if remove_nulls:
                 del dic[k]
             else:
@@ -51,66 +67,112 @@ def merge_lists(dic, remove_nulls):
                 for t in val_tuple:
                     dic[k].append({subkey: t[i] for i, subkey in enumerate(keys)})
             else:
-                merge_lists(v, remove_nulls)
+                merge_lists(v, remove_nulls, isnull)
         elif isinstance(v, list):
             dic[k] = list(set(v))  # removing list duplicates
 
 
+def parse_datatypes(content):
+    """
+    Parse the content of a datatypes file.
+
+    Args:
+        content (str): YAML or legacy Python literal content
+
+    Returns:
+        dict: Dictionary of datatypes
+    """
+    # Try to parse as YAML first (more secure)
+    try:
+        data = yaml.load(content, Loader=YAML_LOADER)
+    except Exception as yaml_error:
+        logger.debug(f"Could not parse as YAML: {yaml_error}")
+        # Fall back to eval for legacy format (less secure)
+        try:
+            data = eval(content)
+
+            # Convert Python types to strings for consistent handling
+            if isinstance(data, dict) and 'fields' in data and isinstance(data['fields'], dict):
+                for key, value in data['fields'].items():
+                    if isinstance(value, type):
+                        data['fields'][key] = value.__name__
+        except Exception as eval_error:
+            logger.error(f"Could not parse file content: {eval_error}")
+            raise
+
+    # Extract fields from the data structure
+    if isinstance(data, dict) and 'fields' in data:
+        datatypes = data['fields']
+    else:
+        datatypes = data
+
+    # Safely log a preview of the datatypes
+    if isinstance(datatypes, dict):
+        preview = str(list(datatypes.keys())[:10])
+        logger.debug(f"Loaded datatypes with keys: {preview}...")
+    elif isinstance(datatypes, list):
+        preview = str(datatypes[:10])
+        logger.debug(f"Loaded datatypes (list): {preview}...")
+    else:
+        logger.debug(f"Loaded datatypes of type: {type(datatypes)}")
+
+    return datatypes
+
+
+@lru_cache(maxsize=32)
+def _load_datatypes_cached(file_path, mtime):
+    """
+    Parse a datatypes file.
+
+    The modification time is part of the cache key, so a changed file is
+    parsed again.
+
+    Args:
+        file_path (str): Path to the datatypes file
+        mtime (int): Modification time of the file in nanoseconds
+
+    Returns:
+        dict: Dictionary of datatypes
+    """
+    with open(file_path, encoding='utf-8') as f:
+        return parse_datatypes(f.read())
+
+
 def load_datatypes(file):
     """
     Load datatypes from a file.
 
+    Parsed files are cached until they are modified. File-like objects are
+    parsed directly and not cached.
+
     Args:
-        file (str): Path to the datatypes file
+        file (str or file-like): Path to the datatypes file, or an open text stream
 
     Returns:
         dict: Dictionary of datatypes
     """
+    # In-memory content needs no file system access
+    if hasattr(file, 'read'):
+        logger.info("Loading datatypes from stream")
+        try:
+            return parse_datatypes(file.read())
+        except Exception as e:
+            logger.error(f"Error loading datatypes: {e}")
+            raise
+
     logger.info(f"Loading datatypes from: {file}")
     try:
         file_path = Path(file)
-        with open(file_path, encoding='utf-8') as f:
-            content = f.read()
-
-            # Try to parse as YAML first (more secure)
-            try:
-                data = yaml.safe_load(content)
-            except Exception as yaml_error:
-                logger.debug(f"Could not parse as YAML: {yaml_error}")
-                # Fall back to eval for legacy format (less secure)
-                try:
-                    data = eval(content)
-
-                    # Convert Python types to strings for consistent handling
-                    if isinstance(data, dict) and 'fields' in data and isinstance(data['fields'], dict):
-                        for key, value in data['fields'].items():
-                            if isinstance(value, type):
-                                data['fields'][key] = value.__name__
-                except Exception as eval_error:
-                    logger.error(f"Could not parse file content: {eval_error}")
-                    raise
-
-            # Extract fields from the data structure
-            if isinstance(data, dict) and 'fields' in data:
-                datatypes = data['fields']
-            else:
-                datatypes = data
-
-            # Safely log a preview of the datatypes
-            if isinstance(datatypes, dict):
-                preview = str(list(datatypes.keys())[:10])
-                logger.debug(f"Loaded datatypes with keys: {preview}...")
-            elif isinstance(datatypes, list):
-                preview = str(datatypes[:10])
-                logger.debug(f"Loaded datatypes (list): {preview}...")
-            else:
-                logger.debug(f"Loaded datatypes of type: {type(datatypes)}")
-
-            return datatypes
+        datatypes = _load_datatypes_cached(str(file_path), file_path.stat().st_mtime_ns)
     except Exception as e:
         logger.error(f"Error loading datatypes: {e}")
         raise
 
+    # Hand out a copy so callers cannot modify the cached result
+    if isinstance(datatypes, (dict, list)):
+        return datatypes.copy()
+    return datatypes
+
 
 def excel_to_json(excel_path, root_element, output_path=None, remove_nulls=False, datatypes_file=None, field_mapping=None, skiprows=0):
     """
@@ -128,6 +190,8 @@ def excel_to_json(excel_path, root_element, output_path=None, remove_nulls=False
     Returns:
         str: Path to the output JSON file
     """
+    import pandas as pd
+
     logger.info(f"Converting Excel file: {excel_path}")
     logger.info(f"Root element: {root_element}")
     logger.info(f"Remove nulls: {remove_nulls}")
@@ -140,7 +204,7 @@ def excel_to_json(excel_path, root_element, output_path=None, remove_nulls=False
     try:
         # Read Excel file
         logger.info(f"Reading Excel file (skipping {skiprows} rows)...")
-        df = pd.read_excel(excel_path, skiprows=skiprows)
+        df = pd.read_excel(excel_path, skiprows=skiprows, engine=EXCEL_ENGINE)
         logger.info(f"Excel file read successfully. Shape: {df.shape}")
 
         # Apply field mapping if provided
@@ -197,7 +261,7 @@ def excel_to_json(excel_path, root_element, output_path=None, remove_nulls=False
 
         for element in raw_json:
             unflatten_dic(element)
-            merge_lists(element, remove_nulls)
+            merge_lists(element, remove_nulls, pd.isnull)
 
         json_data = {root_element: raw_json}
 
@@ -224,9 +288,13 @@ def get_excel_headers(excel_path, skiprows=0):
     Returns:
         list: List of column headers as strings
     """
+    import pandas as pd
+
     logger.info(f"Getting headers from Excel file: {excel_path} (skipping {skiprows} rows)")
     try:
-        df = pd.read_excel(excel_path, skiprows=skiprows)
+        # Only the headers are needed; one data row is read because pandas
+        # names the columns of a wider data row "Unnamed: N", as a full read does
+        df = pd.read_excel(excel_path, skiprows=skiprows, nrows=1, engine=EXCEL_ENGINE)
         # Convert all headers to strings to avoid type issues when creating QLabel widgets
         headers = [str(col) for col in df.columns]
         logger.info(f"Found {len(headers)} headers: {headers[:10]}...")
@@ -236,7 +304,7 @@ def get_excel_headers(excel_path, skiprows=0):
         return []
 
 
-def csv_to_json(csv_path, root_element, output_path=None, remove_nulls=False, datatypes_file=None, skiprows=0):
+def csv_to_json(csv_path, root_element, output_path=None, remove_nulls=False, datatypes_file=None, skiprows=0, engine="c"):
     """
     Convert CSV file to JSON.
 
@@ -247,10 +315,13 @@ def csv_to_json(csv_path, root_element, output_path=None, remove_nulls=False, da
         remove_nulls (bool, optional): Whether to remove null values. Defaults to False.
         datatypes_file (str, optional): Path to datatypes file. Defaults to None.
         skiprows (int, optional): Number of rows to skip from the beginning of the file. Defaults to 0.
+        engine (str, optional): CSV parser engine, "c" or the multi-threaded "pyarrow". Defaults to "c".
 
     Returns:
         str: Path to the output JSON file
     """
+    import pandas as pd
+
     logger.info(f"Converting CSV file: {csv_path}")
     logger.info(f"Root element: {root_element}")
     logger.info(f"Remove nulls: {remove_nulls}")
@@ -275,13 +346,13 @@ def csv_to_json(csv_path, root_element, output_path=None, remove_nulls=False, da
                 logger.error(f"Could not load datatypes: {dt_error}")
 
         # Read CSV file
-        logger.info(f"Reading CSV file (skipping {skiprows} rows)...")
+        logger.info(f"Reading CSV file with the {engine} engine (skipping {skiprows} rows)...")
         if datatypes:
             logger.debug("Reading CSV with datatypes...")
-            df = pd.read_csv(csv_path, sep=";", engine="c", dtype=datatypes, decimal=',', skiprows=skiprows)
+            df = pd.read_csv(csv_path, sep=";", engine=engine, dtype=datatypes, decimal=',', skiprows=skiprows)
         else:
             logger.debug("Reading CSV without datatypes...")
-            df = pd.read_csv(csv_path, sep=";", engine="c", decimal=',', skiprows=skiprows)
+            df = pd.read_csv(csv_path, sep=";", engine=engine, decimal=',', skiprows=skiprows)
         logger.info(f"CSV file read successfully. Shape: {df.shape}")
 
         # Convert to JSON with nested structure
@@ -291,7 +362,7 @@ def csv_to_json(csv_path, root_element, output_path=None, remove_nulls=False, da
 
         for element in raw_json:
             unflatten_dic(element)
-            merge_lists(element, remove_nulls)
+            merge_lists(element, remove_nulls, pd.isnull)
 
         json_data = {root_element: raw_json}
 
@@ -4,11 +4,43 @@ File service for the CSV2JSON converter.
 
 import os
 import json
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
 from pathlib import Path
-import pandas as pd
 
 from src.csv2json.core.logging import logger
 
+# orjson decodes JSON considerably faster than the json module, but is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def supports_calamine():
+    """
+    Check if the calamine Excel engine can be used.
+
+    The engine needs the python-calamine package and pandas 2.2 or newer.
+    The pandas version is read from the package metadata, so pandas is not
+    imported.
+
+    Returns:
+        bool: True if pandas can read Excel files with calamine
+    """
+    if not find_spec("python_calamine"):
+        return False
+    try:
+        major, minor = (int(part) for part in version("pandas").split(".")[:2])
+    except (PackageNotFoundError, ValueError):
+        return False
+    return (major, minor) >= (2, 2)
+
+
+# Excel reader engine: the Rust-based calamine reader is much faster than
+# openpyxl, but optional. None lets pandas choose its default engine.
+EXCEL_ENGINE = "calamine" if supports_calamine() else None
+
 
 class FileService:
     """
@@ -29,7 +61,11 @@ class FileService:
         """
         logger.info(f"Getting headers from Excel file: {excel_path} (skipping {skiprows} rows)")
         try:
-            df = pd.read_excel(excel_path, skiprows=skiprows)
+            import pandas as pd
+
+            # Only the headers are needed; one data row is read because pandas
+            # names the columns of a wider data row "Unnamed: N", as a full read does
+            df = pd.read_excel(excel_path, skiprows=skiprows, nrows=1, engine=EXCEL_ENGINE)
             # Convert all headers to strings to avoid type issues when creating QLabel widgets
             headers = [str(col) for col in df.columns]
             logger.info(f"Found {len(headers)} headers: {headers[:10]}...")
@@ -113,9 +149,17 @@ class FileService:
         """
         logger.info(f"Loading mapping from file: {file_path}")
         try:
-            # Read the mapping from a JSON file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read the mapping from a JSON file in one call and decode the bytes
+            raw = Path(file_path).read_bytes()
+            data = None
+            if orjson:
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # orjson rejects a byte order mark and NaN, json accepts both
+                    pass
+            if data is None:
+                data = json.loads(raw)
 
             # Validate the file format
             if not isinstance(data, dict) or "mapping" not in data:
@@ -26,10 +26,17 @@ logger.addHandler(console_handler)
 # In-memory log storage for GUI display
 log_records = []
 
+# Number of records stored so far; each record is tagged with its number so
+# the GUI can tell which records a snapshot of the logs already contains
+log_record_count = 0
+
 class MemoryHandler(logging.Handler):
     """Custom handler that stores log records in memory for GUI display."""
     
     def emit(self, record):
+        global log_record_count
+        log_record_count += 1
+        record.log_index = log_record_count
         log_records.append(self.format(record))
         # Keep only the last 1000 records to avoid memory issues
         if len(log_records) > 1000:
@@ -40,6 +47,45 @@ memory_handler = MemoryHandler()
 memory_handler.setFormatter(log_format)
 logger.addHandler(memory_handler)
 
+class SignalHandler(logging.Handler):
+    """Custom handler that forwards formatted log records to a Qt signal."""
+    
+    def __init__(self, signal):
+        super().__init__()
+        self.signal = signal
+    
+    def emit(self, record):
+        self.signal.emit(getattr(record, 'log_index', 0), self.format(record))
+
+# Qt emitter for new log records, created on first use by the GUI
+log_emitter = None
+
+def get_log_emitter():
+    """
+    Get the emitter that announces new log records to the GUI.
+    
+    The emitter is created lazily so the command-line interface does not
+    have to import Qt. Its ``record_emitted`` signal carries the number of
+    the record (see ``get_log_snapshot``) and the formatted log line, and
+    may be emitted from any thread.
+    
+    Returns:
+        LogSignalEmitter: The shared log signal emitter.
+    """
+    global log_emitter
+    if log_emitter is None:
+        from PyQt6.QtCore import QObject, pyqtSignal
+        
+        class LogSignalEmitter(QObject):
+            """Qt object emitting a signal for every new log record."""
+            record_emitted = pyqtSignal(int, str)
+        
+        log_emitter = LogSignalEmitter()
+        signal_handler = SignalHandler(log_emitter.record_emitted)
+        signal_handler.setFormatter(log_format)
+        logger.addHandler(signal_handler)
+    return log_emitter
+
 def setup_file_logging(log_dir=None):
     """
     Set up file logging.
@@ -75,6 +121,22 @@ def get_logs():
     """
     return log_records
 
+def get_log_snapshot():
+    """
+    Get a copy of all log records together with the number of the last one.
+    
+    Records announced by the log emitter with a number up to the returned
+    one are already contained in the copy.
+    
+    Returns:
+        tuple: List of log records and the number of the last stored record.
+    """
+    memory_handler.acquire()
+    try:
+        return list(log_records), log_record_count
+    finally:
+        memory_handler.release()
+
 def clear_logs():
     """Clear all log records."""
     log_records.clear()
@@ -6,9 +6,12 @@ import os
 import sys
 import glob
 import logging
+import threading
 import yaml
 from pathlib import Path
 
+from src.csv2json.core.converter import YAML_LOADER
+
 # Get logger
 logger = logging.getLogger('csv2json')
 
@@ -49,15 +52,17 @@ EXE_DIR = os.path.dirname(sys.executable) if is_bundled() else None
 if EXE_DIR:
     logger.info(f"Executable directory: {EXE_DIR}")
 
-def get_datatype_files():
+# Cached root element mapping, rebuilt when the schema files change
+_root_mapping_lock = threading.Lock()
+_root_mapping_cache = None
+
+def get_search_paths():
     """
-    Get a list of all available datatype files.
+    Get the directories that are searched for schema files.
 
     Returns:
-        list: List of datatype file paths
+        list: List of directory paths, in order of preference
     """
-    dt_files = []
-
     # Try multiple locations to find schema files
     search_paths = [DATA_DIR]
 
@@ -71,6 +76,18 @@ def get_datatype_files():
         search_paths.append(os.path.join(EXE_DIR, 'csv2json', 'data'))
         search_paths.append(os.path.join(EXE_DIR, 'data'))
 
+    return search_paths
+
+def get_datatype_files():
+    """
+    Get a list of all available datatype files.
+
+    Returns:
+        list: List of datatype file paths
+    """
+    dt_files = []
+    search_paths = get_search_paths()
+
     # Search all paths for schema files (.dt, .yaml, .yml)
     for path in search_paths:
         try:
@@ -121,7 +138,7 @@ def get_datatype_info(file_path):
 
             # Try to parse as YAML first (more secure)
             try:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=YAML_LOADER)
             except Exception as yaml_error:
                 logger.debug(f"Could not parse as YAML: {yaml_error}")
                 # Fall back to eval for legacy format (less secure)
@@ -146,17 +163,7 @@ def get_datatype_path(name):
         str: Full path to the datatype file
     """
     # Try multiple locations to find the schema file
-    search_paths = [DATA_DIR]
-
-    # Add project root for development
-    if os.path.exists(PROJECT_ROOT):
-        search_paths.append(PROJECT_ROOT)
-
-    # Add executable directory for PyInstaller
-    if EXE_DIR and os.path.exists(EXE_DIR):
-        search_paths.append(EXE_DIR)
-        search_paths.append(os.path.join(EXE_DIR, 'csv2json', 'data'))
-        search_paths.append(os.path.join(EXE_DIR, 'data'))
+    search_paths = get_search_paths()
 
     # Search all paths for the schema file in different formats
     for path in search_paths:
@@ -181,3 +188,105 @@ def get_datatype_path(name):
     default_path = os.path.join(DATA_DIR, f"{name}.dt")
     logger.warning(f"Could not find schema file for {name} in any search path. Using default path: {default_path}")
     return default_path
+
+# Paths of the datatype files found so far, by name; misses are not cached
+_datatype_path_cache = {}
+
+def resolve_datatype_path(name):
+    """
+    Get the path to an existing datatype file.
+
+    Found paths are cached, but a cached path is only returned while the
+    file still exists. Missing files are searched again on every call, so
+    files added later are picked up.
+
+    Args:
+        name (str): Name of the datatype file without extension
+
+    Returns:
+        str: Full path to the datatype file, or None if it does not exist
+    """
+    datatype_path = _datatype_path_cache.get(name)
+    if datatype_path is not None and os.path.isfile(datatype_path):
+        return datatype_path
+
+    datatype_path = get_datatype_path(name)
+    if os.path.isfile(datatype_path):
+        _datatype_path_cache[name] = datatype_path
+        return datatype_path
+    _datatype_path_cache.pop(name, None)
+    return None
+
+def _get_mtimes(paths):
+    """
+    Get the modification times of a list of paths.
+
+    Args:
+        paths (list): List of file or directory paths
+
+    Returns:
+        tuple: Modification time for each path, or None if it does not exist
+    """
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.path.getmtime(path))
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+def get_root_mapping():
+    """
+    Get the available root elements from the schema files.
+
+    The mapping is built once and reused until a schema file or one of the
+    search directories is modified.
+
+    Returns:
+        tuple: Dictionary mapping display names to root element names, and
+            the sorted list of display names
+    """
+    global _root_mapping_cache
+    with _root_mapping_lock:
+        search_paths = get_search_paths()
+        if _root_mapping_cache is not None:
+            cached_paths, cached_files, cached_mtimes, mapping, sorted_displays = _root_mapping_cache
+            if cached_paths == search_paths and cached_mtimes == _get_mtimes(search_paths + cached_files):
+                return mapping, sorted_displays
+
+        datatype_files = get_datatype_files()
+        _datatype_path_cache.clear()
+
+        # Create a mapping of display names to root element names
+        mapping = {}
+        for file_path in datatype_files:
+            # Get datatype info from the file
+            info = get_datatype_info(file_path)
+
+            # Extract the root element name (filename without extension)
+            file_name = Path(file_path).stem
+
+            # If it's a _schema file, extract the base name
+            if file_name.endswith('_schema'):
+                file_name = file_name[:-7]  # Remove '_schema' suffix
+
+            # Use displayName if available, otherwise use the file name
+            display_name = info.get('displayName', file_name)
+
+            # Use root if available, otherwise use the file name
+            root_name = info.get('root', file_name)
+
+            # Add to mapping
+            mapping[display_name] = root_name
+
+            logger.debug(f"Added root element mapping: {display_name} -> {root_name}")
+
+        sorted_displays = sorted(mapping.keys())
+        _root_mapping_cache = (
+            search_paths,
+            datatype_files,
+            _get_mtimes(search_paths + datatype_files),
+            mapping,
+            sorted_displays,
+        )
+        return mapping, sorted_displays
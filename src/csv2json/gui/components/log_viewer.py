@@ -3,12 +3,12 @@ Log viewer component for the CSV2JSON converter.
 """
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTextEdit,
-                           QPushButton, QFileDialog, QLabel, QComboBox,
-                           QCheckBox)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QTextCursor
+                           QPushButton, QLabel, QComboBox, QCheckBox)
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QFont
 
-from src.csv2json.core.logging import get_logs, clear_logs, export_logs, logger
+from src.csv2json.core.logging import (get_log_snapshot, clear_logs, export_logs,
+                                       get_log_emitter, logger)
 
 
 class LogViewer(QDialog):
@@ -71,6 +71,9 @@ class LogViewer(QDialog):
         self.log_text.setReadOnly(True)
         self.log_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
         
+        # The view is read-only, so programmatic updates need no undo history
+        self.log_text.setUndoRedoEnabled(False)
+        
         # Use monospace font for better log readability
         font = QFont("Courier New")
         font.setStyleHint(QFont.StyleHint.Monospace)
@@ -78,30 +81,103 @@ class LogViewer(QDialog):
         
         layout.addWidget(self.log_text)
         
-        # Set up auto-refresh timer
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_logs)
-        self.refresh_timer.start(1000)  # Refresh every second
+        # Buffer new records and flush them in bursts of at most one per 100 ms
+        self.pending_records = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(100)
+        self.flush_timer.timeout.connect(self.flush_pending_records)
+        
+        # Get notified by the logger instead of polling for changes; the
+        # connection only exists while the dialog is shown
+        self.log_emitter = get_log_emitter()
         
         # Track scroll position
         self.was_at_bottom = True
         
-        # Initial log load
+        # Number of the last record contained in the displayed snapshot
+        self.shown_count = 0
+    
+    def showEvent(self, event):
+        """Reload the logs and follow new records while the dialog is shown."""
+        super().showEvent(event)
+        self.log_emitter.record_emitted.connect(
+            self.on_record_emitted, Qt.ConnectionType.QueuedConnection
+        )
         self.refresh_logs()
         logger.info("Log viewer opened")
     
+    def hideEvent(self, event):
+        """Stop following new records while the dialog is hidden."""
+        self.log_emitter.record_emitted.disconnect(self.on_record_emitted)
+        self.flush_timer.stop()
+        self.pending_records.clear()
+        super().hideEvent(event)
+    
     def toggle_auto_refresh(self, state):
         """Toggle auto-refresh on/off."""
         if state == Qt.CheckState.Checked.value:
-            self.refresh_timer.start(1000)
+            # Catch up with records logged while auto-refresh was off
+            self.refresh_logs()
             logger.debug("Auto-refresh enabled")
         else:
-            self.refresh_timer.stop()
+            self.flush_timer.stop()
+            self.pending_records.clear()
             logger.debug("Auto-refresh disabled")
     
+    @pyqtSlot(int, str)
+    def on_record_emitted(self, index, record):
+        """
+        Queue a new log record for display.
+        
+        Args:
+            index (int): Number of the log record
+            record (str): The formatted log record
+        """
+        if not self.auto_refresh_check.isChecked():
+            return
+        # Records logged before the last refresh are already displayed
+        if index <= self.shown_count:
+            return
+        self.pending_records.append(record)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    @pyqtSlot()
+    def flush_pending_records(self):
+        """Append the queued log records to the display."""
+        from PyQt6.QtGui import QTextCursor
+
+        records = self.pending_records
+        self.pending_records = []
+        
+        # Apply filter if needed
+        level_filter = self.level_combo.currentText()
+        if level_filter != "All":
+            records = [record for record in records if f" - {level_filter} - " in record]
+        if not records:
+            return
+        
+        scroll_bar = self.log_text.verticalScrollBar()
+        if self.newest_first_check.isChecked():
+            # Insert the new records at the top, newest first
+            cursor = QTextCursor(self.log_text.document())
+            cursor.movePosition(QTextCursor.MoveOperation.Start)
+            cursor.insertText("\n".join(reversed(records)) + "\n")
+            scroll_bar.setValue(scroll_bar.minimum())
+        else:
+            self.log_text.append("\n".join(records))
+            scroll_bar.setValue(scroll_bar.maximum())
+    
     def refresh_logs(self):
         """Refresh the log display."""
-        logs = get_logs()
+        from PyQt6.QtGui import QTextCursor
+
+        logs, self.shown_count = get_log_snapshot()
+        
+        # Queued records were stored before the snapshot was taken
+        self.flush_timer.stop()
+        self.pending_records.clear()
         
         # Apply filter if needed
         level_filter = self.level_combo.currentText()
@@ -144,6 +220,8 @@ class LogViewer(QDialog):
     
     def export_logs(self):
         """Export logs to a file."""
+        from PyQt6.QtWidgets import QFileDialog
+
         logger.info("Exporting logs")
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Logs", "", "Log Files (*.log);;Text Files (*.txt);;All Files (*)"
@@ -161,5 +239,4 @@ class LogViewer(QDialog):
     def closeEvent(self, event):
         """Handle dialog close event."""
         logger.info("Log viewer closed")
-        self.refresh_timer.stop()
         event.accept()
@@ -14,8 +14,23 @@ class DraggableChip(QLabel):
     """
     A draggable chip widget representing an Excel header.
     """
+    # Enhanced styling for the chip with better text handling
+    CHIP_STYLE = """
+        QLabel {
+            background-color: palette(highlight);
+            color: palette(highlightedText);
+            border-radius: 10px;
+            padding: 6px 10px;
+            margin: 3px;
+            min-height: 20px;
+            max-height: 60px;
+        }
+    """
+
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
+        # Pixmap shown while dragging, rendered on first drag
+        self._drag_pixmap = None
         self.update_style()
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
@@ -43,18 +58,17 @@ class DraggableChip(QLabel):
 
     def update_style(self):
         """Update the style based on the theme mode."""
-        # Enhanced styling for the chip with better text handling
-        self.setStyleSheet("""
-            QLabel {
-                background-color: palette(highlight);
-                color: palette(highlightedText);
-                border-radius: 10px;
-                padding: 6px 10px;
-                margin: 3px;
-                min-height: 20px;
-                max-height: 60px;
-            }
-        """)
+        # The drag pixmap has to be rendered again with the new style
+        self._drag_pixmap = None
+
+        # Style sheets are parsed on every set, so only set it once
+        if self.styleSheet() != self.CHIP_STYLE:
+            self.setStyleSheet(self.CHIP_STYLE)
+
+    def resizeEvent(self, event):
+        # The drag pixmap no longer matches the chip size
+        self._drag_pixmap = None
+        super().resizeEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -75,8 +89,9 @@ class DraggableChip(QLabel):
         drag.setMimeData(mime_data)
 
         # Create a pixmap of the chip for visual feedback during drag
-        pixmap = self.grab()
-        drag.setPixmap(pixmap)
+        if self._drag_pixmap is None:
+            self._drag_pixmap = self.grab()
+        drag.setPixmap(self._drag_pixmap)
         drag.setHotSpot(event.pos())
 
         # Start the drag operation
@@ -87,6 +102,16 @@ class ChipContainer(QFrame):
     """
     A container for draggable chips that arranges them in a flowing layout.
     """
+    # Enhanced styling for the container
+    CONTAINER_STYLE = """
+        ChipContainer {
+            min-height: 100px;
+            border: 1px solid palette(mid);
+            border-radius: 5px;
+            background-color: palette(base);
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
@@ -106,15 +131,9 @@ class ChipContainer(QFrame):
 
     def update_style(self):
         """Update the style based on the theme mode."""
-        # Enhanced styling for the container
-        self.setStyleSheet("""
-            ChipContainer {
-                min-height: 100px;
-                border: 1px solid palette(mid);
-                border-radius: 5px;
-                background-color: palette(base);
-            }
-        """)
+        # Style sheets are parsed on every set, so only set it once
+        if self.styleSheet() != self.CONTAINER_STYLE:
+            self.setStyleSheet(self.CONTAINER_STYLE)
 
     def add_chip(self, text):
         """Add a new chip to the container."""
@@ -125,7 +144,15 @@ class ChipContainer(QFrame):
 
     def clear_chips(self):
         """Remove all chips from the container."""
-        for chip in self.chips:
-            self.layout.removeWidget(chip)
-            chip.deleteLater()
+        # Suspend the layout so removing the chips does not relayout each time
+        self.layout.setEnabled(False)
+        # Take the items out of the layout explicitly, so no item is left
+        # pointing at a deleted chip
+        while (item := self.layout.takeAt(0)) is not None:
+            chip = item.widget()
+            if chip is not None:
+                chip.setParent(None)
+                chip.deleteLater()
         self.chips = []
+        self.layout.setEnabled(True)
+        self.layout.invalidate()
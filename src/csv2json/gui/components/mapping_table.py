@@ -2,35 +2,146 @@
 Mapping table component for the CSV2JSON converter.
 """
 
-from PyQt6.QtWidgets import (QTableWidget, QTableWidgetItem, QHeaderView,
-                           QAbstractItemView, QMenu)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QMenu
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
 
 from src.csv2json.core.logging import logger
 
 
-class MappingTable(QTableWidget):
+class MappingModel(QAbstractTableModel):
     """
-    A table widget for mapping Excel headers to target fields.
+    Table model holding target fields, data types and mapped source fields.
+
+    The columns are stored as three parallel lists so that the view only
+    queries the cells that are currently visible.
+    """
+    HEADERS = ["Target Field", "Data Type", "Source Field"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.target_fields = []
+        self.dtypes = []
+        self.source_fields = []
+        self._columns = (self.target_fields, self.dtypes, self.source_fields)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.target_fields)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 3
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._columns[index.column()][index.row()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def load_datatypes(self, datatypes_dict):
+        """
+        Replace all rows with the fields of a datatypes dictionary.
+
+        Args:
+            datatypes_dict (dict): Dictionary mapping field names to data types
+        """
+        self.beginResetModel()
+        self.target_fields.clear()
+        self.dtypes.clear()
+        self.source_fields.clear()
+
+        for field, dtype in datatypes_dict.items():
+            self.target_fields.append(field)
+
+            # Data type - format it nicely
+            dtype_str = str(dtype)
+            if dtype_str.startswith("<class '") and dtype_str.endswith("'>"):
+                # Extract the type name from the class representation
+                dtype_str = dtype_str[8:-2].split('.')[-1]
+            self.dtypes.append(dtype_str)
+
+            # Source field (empty initially)
+            self.source_fields.append("")
+        self.endResetModel()
+
+    def set_source_field(self, row, source_field):
+        """
+        Set the source field of a single row.
+
+        Args:
+            row (int): Row index
+            source_field (str): Source field name, or an empty string to unmap
+        """
+        self.source_fields[row] = source_field
+        index = self.index(row, 2)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def update_source_fields(self, mapping):
+        """
+        Set the source fields of several rows at once.
+
+        Args:
+            mapping (dict): Dictionary mapping target fields to source fields
+        """
+        row_of = {target: row for row, target in enumerate(self.target_fields)}
+        rows = []
+        for target, source in mapping.items():
+            row = row_of.get(target)
+            if row is not None:
+                self.source_fields[row] = source
+                rows.append(row)
+
+        # Notify the view once for the whole changed range
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), 2),
+                self.index(max(rows), 2),
+                [Qt.ItemDataRole.DisplayRole]
+            )
+
+    def clear_source_fields(self):
+        """Clear the source field of every row."""
+        if not self.source_fields:
+            return
+        self.source_fields[:] = [""] * len(self.source_fields)
+        self.dataChanged.emit(
+            self.index(0, 2),
+            self.index(len(self.source_fields) - 1, 2),
+            [Qt.ItemDataRole.DisplayRole]
+        )
+
+
+class MappingTable(QTableView):
+    """
+    A table view for mapping Excel headers to target fields.
     """
     mapping_changed = pyqtSignal(dict)  # Signal emitted when mapping changes
     field_unmapped = pyqtSignal(str)  # Signal emitted when a field is unmapped
 
     def __init__(self, parent=None):
-        super().__init__(0, 3, parent)  # 3 columns: Target Field, Data Type, Source Field
+        super().__init__(parent)
         self.setAcceptDrops(True)
         self.update_style()
 
         # Set up the table
-        self.setHorizontalHeaderLabels(["Target Field", "Data Type", "Source Field"])
+        self.mapping_model = MappingModel(self)
+        self.setModel(self.mapping_model)
         self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
-        # Hide the vertical header (row numbers)
+        # Hide the vertical header (row numbers) and use a fixed row height
         self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 10)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
@@ -40,15 +151,8 @@ class MappingTable(QTableWidget):
     def update_style(self):
         """Update the style based on the theme mode."""
         # Remove all custom styling and let Fusion handle it
-        self.setStyleSheet("")
-
-        # Clear any custom background colors from cells
-        for row in range(self.rowCount()):
-            for col in range(self.columnCount()):
-                item = self.item(row, col)
-                if item:
-                    item.setData(Qt.ItemDataRole.BackgroundRole, None)
-                    item.setData(Qt.ItemDataRole.ForegroundRole, None)
+        if self.styleSheet():
+            self.setStyleSheet("")
 
     def load_datatypes(self, datatypes_dict):
         """
@@ -57,33 +161,36 @@ class MappingTable(QTableWidget):
         Args:
             datatypes_dict (dict): Dictionary mapping field names to data types
         """
-        self.clear()
-        self.setRowCount(0)
-        self.setHorizontalHeaderLabels(["Target Field", "Data Type", "Source Field"])
-
         # Reset the mapping
+        had_mapping = bool(self.field_mapping)
         self.field_mapping = {}
 
-        # Add rows for each field
-        for i, (field, dtype) in enumerate(datatypes_dict.items()):
-            self.insertRow(i)
+        self.mapping_model.load_datatypes(datatypes_dict)
 
-            # Target field
-            field_item = QTableWidgetItem(field)
-            self.setItem(i, 0, field_item)
+        # Let listeners drop the mapping of the previous target fields
+        if had_mapping:
+            self.mapping_changed.emit(self.field_mapping)
 
-            # Data type - format it nicely
-            dtype_str = str(dtype)
-            if dtype_str.startswith("<class '") and dtype_str.endswith("'>"):
-                # Extract the type name from the class representation
-                dtype_str = dtype_str[8:-2].split('.')[-1]
-            dtype_item = QTableWidgetItem(dtype_str)
-            self.setItem(i, 1, dtype_item)
+    def target_at(self, row):
+        """
+        Get the target field shown in a row.
 
-            # Source field (empty initially)
-            source_item = QTableWidgetItem("")
-            # Let the Fusion style handle the background color
-            self.setItem(i, 2, source_item)
+        Args:
+            row (int): Row index
+
+        Returns:
+            str: Target field name
+        """
+        return self.mapping_model.target_fields[row]
+
+    def get_target_fields(self):
+        """
+        Get all target fields in row order.
+
+        Returns:
+            list: List of target field names
+        """
+        return list(self.mapping_model.target_fields)
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasText():
@@ -106,10 +213,10 @@ class MappingTable(QTableWidget):
         """
         row = self.rowAt(position.y())
         if row >= 0:
-            source_item = self.item(row, 2)
-            if source_item and source_item.text():
+            source_field = self.mapping_model.source_fields[row]
+            if source_field:
                 # Only show context menu for mapped fields
-                target_field = self.item(row, 0).text()
+                target_field = self.target_at(row)
 
                 menu = QMenu(self)
                 remove_action = menu.addAction("Remove Mapping")
@@ -117,10 +224,7 @@ class MappingTable(QTableWidget):
 
                 if action == remove_action:
                     # Clear the source field cell
-                    source_field = source_item.text()
-                    empty_item = QTableWidgetItem("")
-                    # No custom background color - use default
-                    self.setItem(row, 2, empty_item)
+                    self.mapping_model.set_source_field(row, "")
 
                     # Remove from mapping
                     if target_field in self.field_mapping:
@@ -141,18 +245,13 @@ class MappingTable(QTableWidget):
             row = self.rowAt(y_pos)
             if row >= 0:
                 # Get the target field
-                target_field = self.item(row, 0).text()
+                target_field = self.target_at(row)
 
                 # Check if this cell already has a mapping
-                old_source_field = None
-                old_item = self.item(row, 2)
-                if old_item and old_item.text():
-                    old_source_field = old_item.text()
+                old_source_field = self.mapping_model.source_fields[row] or None
 
                 # Update the source field cell
-                source_item = QTableWidgetItem(source_field)
-                # No custom styling - let Fusion handle it
-                self.setItem(row, 2, source_item)
+                self.mapping_model.set_source_field(row, source_field)
 
                 # Update the mapping
                 self.field_mapping[target_field] = source_field
@@ -178,16 +277,23 @@ class MappingTable(QTableWidget):
         """
         return self.field_mapping
 
+    def set_mapping(self, mapping):
+        """
+        Show a complete mapping in the table without emitting signals.
+
+        Args:
+            mapping (dict): Dictionary mapping target fields to source fields
+        """
+        self.mapping_model.update_source_fields(mapping)
+        self.field_mapping = mapping
+
     def clear_mapping(self):
         """Clear the current mapping."""
         # Get all source fields before clearing
         old_source_fields = list(self.field_mapping.values())
 
         # Clear the source field cells
-        for row in range(self.rowCount()):
-            source_item = QTableWidgetItem("")
-            # Let the Fusion style handle the background color
-            self.setItem(row, 2, source_item)
+        self.mapping_model.clear_source_fields()
 
         # Reset the mapping
         self.field_mapping = {}
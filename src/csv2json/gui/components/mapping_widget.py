@@ -4,8 +4,8 @@ Mapping widget component for the CSV2JSON converter.
 
 import re
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                           QPushButton, QTableWidgetItem, QFileDialog, QMessageBox)
-from PyQt6.QtCore import pyqtSignal, QSize
+                           QPushButton, QFileDialog, QMessageBox)
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QSize, QEvent
 from PyQt6.QtGui import QIcon
 import qtawesome as qta
 
@@ -15,6 +15,9 @@ from src.csv2json.gui.components.mapping_chips import ChipContainer
 from src.csv2json.gui.components.mapping_table import MappingTable
 from src.csv2json.gui.services.mapping_service import MappingService
 
+# Matches "field": type entries in a datatypes string
+DATATYPES_PATTERN = re.compile(r'"([^"]+)"\s*:\s*([^,\n\}]+)')
+
 
 class MappingWidget(QWidget):
     """
@@ -84,8 +87,12 @@ class MappingWidget(QWidget):
         self.mapping_table.field_unmapped.connect(self.on_field_unmapped)
         layout.addWidget(self.mapping_table)
 
-        # Store the hidden chips
+        # Store the hidden chips and the source fields they are hidden for
         self.hidden_chips = {}
+        self._prev_mapping_values = set()
+
+        # Palette the chips were last styled for
+        self._theme_token = self.palette().cacheKey()
 
         # Add buttons for auto-mapping, clearing, exporting, and importing
         button_layout = QHBoxLayout()
@@ -118,8 +125,20 @@ class MappingWidget(QWidget):
         # Initialize button states
         self.update_button_states()
 
+    def changeEvent(self, event):
+        """Restyle the child widgets when the palette changes, e.g. on a theme switch."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.PaletteChange:
+            self.update_theme()
+
     def update_theme(self):
         """Update the theme for all child widgets."""
+        # Nothing to do if the palette did not change
+        theme_token = self.palette().cacheKey()
+        if theme_token == self._theme_token:
+            return
+        self._theme_token = theme_token
+
         self.source_container.update_style()
         self.mapping_table.update_style()
 
@@ -161,7 +180,11 @@ class MappingWidget(QWidget):
 
         # Clear existing chips
         self.source_container.clear_chips()
-        self.hidden_chips = {}
+        self.hidden_chips = dict.fromkeys(fields)
+
+        # Suspend painting and layout while the chips are added
+        self.source_container.setUpdatesEnabled(False)
+        self.source_container.layout.setEnabled(False)
 
         # Add new chips and hide those that are already mapped
         for field in fields:
@@ -171,7 +194,13 @@ class MappingWidget(QWidget):
             # Hide chip if it's already mapped
             if field in mapped_fields:
                 chip.setVisible(False)
-                logger.debug(f"Kept chip hidden for already mapped field: {field}")
+                logger.debug("Kept chip hidden for already mapped field: %s", field)
+
+        # Lay out all new chips in a single pass
+        self.source_container.layout.setEnabled(True)
+        self.source_container.layout.activate()
+        self.source_container.setUpdatesEnabled(True)
+        self._prev_mapping_values = mapped_fields
 
         # Update application state
         self.has_source_fields = len(fields) > 0
@@ -195,8 +224,7 @@ class MappingWidget(QWidget):
                 logger.info(f"Found {len(datatypes_dict)} datatypes in dictionary")
             elif isinstance(datatypes, str):
                 # If it's a string, extract field names and types using regex
-                pattern = r'"([^"]+)"\s*:\s*([^,\n\}]+)'  # Matches "field": type
-                matches = re.findall(pattern, datatypes)
+                matches = DATATYPES_PATTERN.findall(datatypes)
 
                 if matches:
                     # Create a dictionary from the matches
@@ -223,6 +251,7 @@ class MappingWidget(QWidget):
         """
         return self.mapping_table.get_mapping()
 
+    @pyqtSlot(dict)
     def on_mapping_changed(self, mapping):
         """
         Handle changes to the field mapping.
@@ -231,10 +260,7 @@ class MappingWidget(QWidget):
             mapping (dict): Updated field mapping
         """
         # Hide chips that are mapped
-        for source_field in mapping.values():
-            if source_field in self.hidden_chips and self.hidden_chips[source_field] is not None:
-                self.hidden_chips[source_field].setVisible(False)
-                logger.debug(f"Hidden chip for mapped field: {source_field}")
+        self.update_chip_visibility(mapping)
 
         # Update application state
         self.has_mapping = len(mapping) > 0
@@ -242,6 +268,34 @@ class MappingWidget(QWidget):
 
         self.mapping_changed.emit(mapping)
 
+    def update_chip_visibility(self, mapping):
+        """
+        Hide the chips of newly mapped fields and show the chips of fields
+        that are no longer mapped.
+
+        Args:
+            mapping (dict): Current field mapping
+        """
+        mapped_values = set(mapping.values())
+        to_hide = mapped_values - self._prev_mapping_values
+        to_show = self._prev_mapping_values - mapped_values
+        self._prev_mapping_values = mapped_values
+        if not to_hide and not to_show:
+            return
+
+        # Repaint the container once for all toggled chips
+        self.source_container.setUpdatesEnabled(False)
+        for source_field in to_hide:
+            if self.hidden_chips.get(source_field) is not None:
+                self.hidden_chips[source_field].setVisible(False)
+                logger.debug("Hidden chip for mapped field: %s", source_field)
+        for source_field in to_show:
+            if self.hidden_chips.get(source_field) is not None:
+                self.hidden_chips[source_field].setVisible(True)
+                logger.debug("Showing chip for unmapped field: %s", source_field)
+        self.source_container.setUpdatesEnabled(True)
+
+    @pyqtSlot(str)
     def on_field_unmapped(self, source_field):
         """
         Handle when a field is unmapped (removed from the mapping table).
@@ -249,11 +303,16 @@ class MappingWidget(QWidget):
         Args:
             source_field (str): The source field that was unmapped
         """
+        # Keep the chip hidden if another target field still uses it
+        if source_field in self._prev_mapping_values:
+            return
+
         # Show the chip again
         if source_field in self.hidden_chips and self.hidden_chips[source_field] is not None:
             self.hidden_chips[source_field].setVisible(True)
             logger.debug(f"Showing chip for unmapped field: {source_field}")
 
+    @pyqtSlot()
     def auto_map_fields(self):
         """
         Automatically map fields based on name similarity.
@@ -261,9 +320,7 @@ class MappingWidget(QWidget):
         logger.info("Starting auto-mapping of fields")
 
         # Get the target fields
-        target_fields = []
-        for row in range(self.mapping_table.rowCount()):
-            target_fields.append(self.mapping_table.item(row, 0).text())
+        target_fields = self.mapping_table.get_target_fields()
 
         # Get the source fields
         source_fields = [chip.original_text for chip in self.source_container.chips]
@@ -271,28 +328,16 @@ class MappingWidget(QWidget):
         # Use the mapping service to auto-map fields
         mapping = self.mapping_service.auto_map_fields(target_fields, source_fields)
 
-        # Update the mapping table
+        # Update the mapping table in one batch
         logger.info(f"Applying {len(mapping)} field mappings to the table")
-        for target, source in mapping.items():
-            for row in range(self.mapping_table.rowCount()):
-                if self.mapping_table.item(row, 0).text() == target:
-                    source_item = QTableWidgetItem(source)
-                    # No custom background color - use default
-                    self.mapping_table.setItem(row, 2, source_item)
-                    break
-
-        # Update the mapping in the table
-        self.mapping_table.field_mapping = mapping
+        self.mapping_table.set_mapping(mapping)
 
         # Emit the mapping changed signal
         self.mapping_changed.emit(mapping)
         logger.info("Mapping changed signal emitted")
 
         # Hide the mapped chips
-        for source_field in mapping.values():
-            if source_field in self.hidden_chips and self.hidden_chips[source_field] is not None:
-                self.hidden_chips[source_field].setVisible(False)
-                logger.debug(f"Hidden chip for mapped field: {source_field}")
+        self.update_chip_visibility(mapping)
 
         # Update application state
         self.has_mapping = len(mapping) > 0
@@ -300,6 +345,7 @@ class MappingWidget(QWidget):
 
         logger.info("Auto-mapping completed successfully")
 
+    @pyqtSlot()
     def clear_mapping(self):
         """
         Clear the current mapping.
@@ -332,24 +378,14 @@ class MappingWidget(QWidget):
         # Clear the current mapping
         self.clear_mapping()
 
-        # Update the mapping table
-        for target, source in mapping.items():
-            for row in range(self.mapping_table.rowCount()):
-                if self.mapping_table.item(row, 0).text() == target:
-                    source_item = QTableWidgetItem(source)
-                    self.mapping_table.setItem(row, 2, source_item)
-                    break
-
-        # Update the mapping in the table
-        self.mapping_table.field_mapping = mapping
+        # Update the mapping table in one batch
+        self.mapping_table.set_mapping(mapping)
 
         # Emit the mapping changed signal
         self.mapping_changed.emit(mapping)
 
         # Hide the mapped chips
-        for source_field in mapping.values():
-            if source_field in self.hidden_chips and self.hidden_chips[source_field] is not None:
-                self.hidden_chips[source_field].setVisible(False)
+        self.update_chip_visibility(mapping)
 
         # Update application state
         self.has_mapping = len(mapping) > 0
@@ -357,6 +393,7 @@ class MappingWidget(QWidget):
 
         logger.info("Mapping set successfully")
 
+    @pyqtSlot()
     def export_mapping(self):
         """
         Export the current mapping to a file.
@@ -403,6 +440,7 @@ class MappingWidget(QWidget):
             )
             logger.error(f"Failed to export mapping to {file_path}")
 
+    @pyqtSlot()
     def import_mapping(self):
         """
         Import a mapping from a file.
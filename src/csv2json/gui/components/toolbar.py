@@ -5,11 +5,10 @@ Toolbar component for the CSV2JSON converter.
 from PyQt6.QtCore import Qt, QSize, pyqtSignal
 from PyQt6.QtWidgets import (QToolBar, QPushButton, QComboBox, QCheckBox,
                            QLabel, QWidget, QSizePolicy, QSpinBox)
-from PyQt6.QtGui import QFontMetrics
 import qtawesome as qta
 
 from src.csv2json.core.logging import logger
-from src.csv2json.data import get_datatype_files, get_datatype_info
+from src.csv2json.data import get_root_mapping
 
 
 class MainToolbar(QToolBar):
@@ -59,6 +58,7 @@ class MainToolbar(QToolBar):
 
         # Track application state
         self.has_file_selected = False
+        self.conversion_running = False
 
         # Set icon size to 24x24 pixels for sharper icons
         self.setIconSize(QSize(24, 24))
@@ -120,9 +120,11 @@ class MainToolbar(QToolBar):
         """
         Update button states based on current application state.
         """
-        # Convert button is enabled only when a file is selected
-        self.convert_button.setEnabled(self.has_file_selected)
-        logger.debug(f"Button states updated: file_selected={self.has_file_selected}")
+        # Convert button is enabled only when a file is selected and no
+        # conversion is running
+        self.convert_button.setEnabled(self.has_file_selected and not self.conversion_running)
+        logger.debug(f"Button states updated: file_selected={self.has_file_selected}, "
+                     f"conversion_running={self.conversion_running}")
 
     def set_file_selected(self, selected):
         """
@@ -135,6 +137,16 @@ class MainToolbar(QToolBar):
         self.update_button_states()
         logger.debug(f"File selected state updated: {selected}")
 
+    def set_conversion_running(self, running):
+        """
+        Set whether a conversion is running.
+
+        Args:
+            running (bool): Whether a conversion is running
+        """
+        self.conversion_running = running
+        self.update_button_states()
+
     def on_skip_rows_changed(self, value):
         """
         Handle skip rows value change.
@@ -150,38 +162,12 @@ class MainToolbar(QToolBar):
         Load available root elements from datatype files.
         """
         try:
-            # Get available datatype files
-            datatype_files = get_datatype_files()
-
-            # Create a mapping of display names to root element names
-            self.root_element_mapping = {}
-
-            for file_path in datatype_files:
-                # Get datatype info from the file
-                info = get_datatype_info(file_path)
-
-                # Extract the root element name (filename without extension)
-                from pathlib import Path
-                file_name = Path(file_path).stem
-
-                # If it's a _schema file, extract the base name
-                if file_name.endswith('_schema'):
-                    file_name = file_name[:-7]  # Remove '_schema' suffix
-
-                # Use displayName if available, otherwise use the file name
-                display_name = info.get('displayName', file_name)
-
-                # Use root if available, otherwise use the file name
-                root_name = info.get('root', file_name)
-
-                # Add to mapping
-                self.root_element_mapping[display_name] = root_name
-
-                logger.debug(f"Added root element mapping: {display_name} -> {root_name}")
+            # Get the mapping of display names to root element names
+            self.root_element_mapping, sorted_displays = get_root_mapping()
 
             # Add to combo box
             self.root_combo.clear()
-            self.root_combo.addItems(sorted(self.root_element_mapping.keys()))
+            self.root_combo.addItems(sorted_displays)
 
             logger.info(f"Loaded {len(self.root_element_mapping)} root elements")
         except Exception as e:
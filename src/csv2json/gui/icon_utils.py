@@ -0,0 +1,153 @@
+"""
+Application icon helpers for the CSV2JSON converter GUI.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+from PyQt6.QtCore import QPoint
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
+
+from src.csv2json.core.logging import logger
+
+# Application icon, created on first use and shared by all windows
+_app_icon = None
+
+# Drawn fallback icon, created on first use
+_fallback_icon = None
+
+# Colors of the fallback icon: CSV file (blue), JSON file (green) and arrow (dark gray)
+CSV_COLOR = QColor(41, 128, 185)
+JSON_COLOR = QColor(39, 174, 96)
+ARROW_COLOR = QColor(52, 73, 94)
+
+
+def is_bundled():
+    """
+    Determine if we're running in a PyInstaller bundle.
+
+    Returns:
+        bool: True if running from a PyInstaller bundle
+    """
+    return getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
+
+
+# Directories the icon is searched in; they do not change while the process runs
+BUNDLE_DIR = sys._MEIPASS if is_bundled() else None
+EXE_DIR = os.path.dirname(sys.executable)
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def iter_icon_paths():
+    """
+    Yield the candidate paths of the icon file, in order of preference.
+
+    The paths are built on demand, so candidates after the first existing
+    file are never computed. Duplicates are skipped.
+
+    Yields:
+        str: Absolute candidate path
+    """
+    seen = set()
+
+    def candidates():
+        if BUNDLE_DIR:
+            # PyInstaller paths
+            yield os.path.join(BUNDLE_DIR, "csv2json", "resources", "csv2json.ico")
+            yield os.path.join(BUNDLE_DIR, "resources", "csv2json.ico")
+            yield os.path.join(BUNDLE_DIR, "csv2json.ico")
+            # Also check executable directory
+            yield os.path.join(EXE_DIR, "csv2json.ico")
+        else:
+            # Development path
+            yield os.path.join(PACKAGE_DIR, "resources", "csv2json.ico")
+
+        # Common paths to try in both modes
+        yield os.path.join("csv2json", "resources", "csv2json.ico")
+        yield os.path.join(EXE_DIR, "csv2json", "resources", "csv2json.ico")
+        # Try the current directory
+        cwd = os.getcwd()
+        yield os.path.join(cwd, "csv2json.ico")
+        yield os.path.join(cwd, "resources", "csv2json.ico")
+        yield os.path.join(cwd, "csv2json", "resources", "csv2json.ico")
+
+    # Some candidates coincide, e.g. when running from the project directory
+    for icon_path in candidates():
+        icon_path = os.path.abspath(icon_path)
+        if icon_path not in seen:
+            seen.add(icon_path)
+            yield icon_path
+
+
+@lru_cache(maxsize=None)
+def get_icon_path():
+    """
+    Find the application icon file.
+
+    The candidate paths do not change while the application runs, so the
+    file system is only searched once.
+
+    Returns:
+        str: Path to the icon file, or None if it was not found
+    """
+    icon_path = next((path for path in iter_icon_paths() if os.path.isfile(path)), None)
+    logger.debug("Icon path search result: %s", icon_path)
+    return icon_path
+
+
+def create_fallback_icon():
+    """
+    Draw a simple application icon for when the icon file is missing.
+
+    The icon is only drawn on the first call and reused afterwards.
+
+    Returns:
+        QIcon: The drawn icon, or an empty icon if drawing failed
+    """
+    global _fallback_icon
+    if _fallback_icon is not None:
+        return _fallback_icon
+
+    try:
+        pixmap = QPixmap(64, 64)
+        pixmap.fill(QColor(255, 255, 255, 0))
+        painter = QPainter(pixmap)
+        painter.setBrush(CSV_COLOR)
+        painter.setPen(CSV_COLOR)
+        painter.drawRect(5, 5, 25, 54)
+        painter.setBrush(JSON_COLOR)
+        painter.setPen(JSON_COLOR)
+        painter.drawRect(34, 5, 25, 54)
+        painter.setBrush(ARROW_COLOR)
+        painter.setPen(ARROW_COLOR)
+        painter.drawPolygon([QPoint(25, 25), QPoint(39, 15), QPoint(39, 35)])
+        painter.end()
+        logger.info("Created fallback icon programmatically")
+        _fallback_icon = QIcon(pixmap)
+        return _fallback_icon
+    except Exception as e:
+        logger.error(f"Error creating fallback icon: {e}")
+        return QIcon()
+
+
+def get_app_icon():
+    """
+    Get the application icon.
+
+    The icon is loaded from the icon file, or drawn if the file is missing,
+    on the first call and reused afterwards.
+
+    Returns:
+        QIcon: The application icon
+    """
+    global _app_icon
+    if _app_icon is None:
+        icon_path = get_icon_path()
+        if icon_path:
+            _app_icon = QIcon(icon_path)
+            logger.info(f"Set application icon: {icon_path}")
+        else:
+            logger.warning("Could not find application icon")
+            _app_icon = create_fallback_icon()
+    return _app_icon
@@ -2,6 +2,7 @@
 Mapping UI components for CSV2JSON converter.
 """
 
+import re
 from PyQt6.QtWidgets import (QWidget, QTableWidget, QTableWidgetItem, QVBoxLayout,
                            QHBoxLayout, QLabel, QFrame, QSizePolicy,
                            QHeaderView, QAbstractItemView, QPushButton, QMenu)
@@ -10,6 +11,9 @@ from PyQt6.QtGui import QDrag
 
 from src.csv2json.core.logging import logger
 
+# Matches "field": type entries in a datatypes string
+DATATYPES_PATTERN = re.compile(r'"([^"]+)"\s*:\s*([^,\n\}]+)')
+
 
 class DraggableChip(QLabel):
     """
@@ -374,11 +378,7 @@ class MappingWidget(QWidget):
             # Parse the datatypes string into a dictionary
             # We need to handle the Python type literals (str, int, etc.)
             # First, let's extract the field names from the JSON-like structure
-            import re
-
-            # Extract field names and types using regex
-            pattern = r'"([^"]+)"\s*:\s*([^,\n\}]+)'  # Matches "field": type
-            matches = re.findall(pattern, datatypes_str)
+            matches = DATATYPES_PATTERN.findall(datatypes_str)
 
             if matches:
                 # Create a dictionary from the matches
@@ -1,15 +1,27 @@
 """
 Mapping service for the CSV2JSON converter GUI.
+
+numpy is imported when fuzzy scores are first computed, so starting the
+GUI does not pay for the numpy import.
 """
 
+import sys
+from functools import lru_cache
+
 from src.csv2json.core.logging import logger
 
+# Field name suffixes that are ignored when comparing names
+SUFFIXES = ('_id', '_name', '_nr', '_no', '_num', '_number')
+
 
 class MappingService:
     """
     Service for handling field mapping operations.
     """
     
+    # Number of auto-map results kept for reuse
+    AUTOMAP_CACHE_SIZE = 32
+    
     def __init__(self):
         # Common word variations to handle
         self.variations = {
@@ -42,12 +54,123 @@ class MappingService:
             'email': ['Email', 'E-Mail', 'EMAIL']
         }
         
-        # Create a reverse lookup for variations (case-insensitive)
-        self.variation_lookup = {}
-        for main, variants in self.variations.items():
+        # Case-folded variations and special-case sources as sets for fast membership
+        # tests; special cases are matched regardless of case like variations.
+        # Case folding also matches German spellings such as Straße and STRASSE.
+        self.variations_lower = {
+            main: frozenset(v.casefold() for v in variants) for main, variants in self.variations.items()
+        }
+        self.special_cases_lower = {
+            target.casefold(): frozenset(s.casefold() for s in sources)
+            for target, sources in self.special_cases.items()
+        }
+        
+        # Main words each case-folded variation belongs to
+        self.variation_mains = {}
+        for main, variants in self.variations_lower.items():
             for variant in variants:
-                self.variation_lookup[variant.lower()] = main
-            self.variation_lookup[main.lower()] = main
+                self.variation_mains.setdefault(variant, set()).add(main)
+        
+        # Create a reverse lookup for variations (case-insensitive); the keys are
+        # interned like the name parts they are compared with
+        self.variation_lookup = {
+            sys.intern(variant.casefold()): main for main, variants in self.variations.items() for variant in (*variants, main)
+        }
+        
+        # Field descriptions and auto-map results of earlier calls; the
+        # variation tables above never change, so the caches stay valid
+        self._describe_field = lru_cache(maxsize=512)(self._describe_field)
+        self._automap_cache = {}
+    
+    def _strip_suffix(self, field_lower):
+        """
+        Remove a known suffix such as _id or _name from a field name.
+        
+        Args:
+            field_lower (str): Lowercased field name
+            
+        Returns:
+            str: Field name without the suffix
+        """
+        if not field_lower.endswith(SUFFIXES):
+            return field_lower
+        
+        # Every suffix is a single underscore-prefixed word
+        field_base = field_lower.rpartition('_')[0]
+        logger.debug("Removed suffix from %s -> %s", field_lower, field_base)
+        return field_base
+    
+    def _get_variations(self, field_base):
+        """
+        Get the parts of a field name together with their known variations.
+        
+        Args:
+            field_base (str): Lowercased field name without suffix
+            
+        Returns:
+            frozenset: Name parts and the main words they are variations of
+        """
+        field_variations = set()
+        for part in field_base.split('_'):
+            # Add the original part, interned as the same words repeat across fields
+            part = sys.intern(part)
+            field_variations.add(part)
+            # Add any known variations (the part is already lowercased)
+            variation = self.variation_lookup.get(part)
+            if variation is not None:
+                field_variations.add(variation)
+                logger.debug("Found variation for '%s': '%s'", part, variation)
+        return frozenset(field_variations)
+    
+    def _describe_field(self, field):
+        """
+        Describe a field name for matching.
+        
+        Args:
+            field (str): Field name
+            
+        Returns:
+            tuple: Case-folded name, name without suffix and its variations
+        """
+        field_lower = field.casefold()
+        field_base = self._strip_suffix(field_lower)
+        return field_lower, field_base, self._get_variations(field_base)
+    
+    def _score_variations(self, target_variations, source_variations):
+        """
+        Score every target against every source by their common variations.
+        
+        The variation sets are encoded as rows of a token matrix, so the
+        common variations of all pairs are counted by a single matrix product.
+        
+        Args:
+            target_variations (list): Variation set of each target field
+            source_variations (list): Variation set of each source field
+            
+        Returns:
+            numpy.ndarray: Score matrix with one row per target and one column per source
+        """
+        import numpy as np
+
+        # Assign a column to every variation token
+        vocab = {}
+        for field_variations in target_variations + source_variations:
+            for token in field_variations:
+                vocab.setdefault(token, len(vocab))
+        
+        targets = np.zeros((len(target_variations), len(vocab)), dtype=np.int32)
+        for row, field_variations in enumerate(target_variations):
+            targets[row, [vocab[token] for token in field_variations]] = 1
+        sources = np.zeros((len(source_variations), len(vocab)), dtype=np.int32)
+        for row, field_variations in enumerate(source_variations):
+            sources[row, [vocab[token] for token in field_variations]] = 1
+        
+        # Share of common variations relative to the larger variation set
+        common = targets @ sources.T
+        scores = common / np.maximum(targets.sum(axis=1)[:, None], sources.sum(axis=1)[None, :])
+        
+        # Boost score for longer matches
+        return np.where(common > 1, scores * 1.5, scores)
     
     def auto_map_fields(self, target_fields, source_fields):
         """
@@ -60,120 +183,125 @@ class MappingService:
         Returns:
             dict: Mapping from target fields to source fields
         """
+        # Debug messages below are formatted lazily, only when debug logging is enabled
         logger.info("Starting auto-mapping of fields")
         logger.info(f"Target fields: {target_fields}")
         logger.info(f"Source fields: {source_fields}")
         
-        # Create a mapping based on matches
+        # Reuse the result of an earlier call with the same fields
+        cache_key = (tuple(target_fields), tuple(source_fields))
+        cached = self._automap_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached auto-mapping with {len(cached)} matches")
+            return dict(cached)
+        
+        # Describe every source field once instead of once per target and index
+        # the sources by name, lowercased name and base name (first source wins)
+        sources_desc = []
+        name_index = {}
+        lower_index = {}
+        base_index = {}
+        for column, source in enumerate(source_fields):
+            source_lower, source_base, source_variations = self._describe_field(source)
+            sources_desc.append((source, source_lower, source_base, source_variations))
+            name_index.setdefault(source, column)
+            lower_index.setdefault(source_lower, column)
+            base_index.setdefault(source_base, column)
+        
+        # Extract the base words from each target (remove _id, _name suffixes)
+        # and check if any part of the target matches a known variation
+        targets_desc = [(target, *self._describe_field(target)) for target in target_fields]
+        
+        # Create a mapping based on matches; targets without a name or rule
+        # based match are collected for scoring
         mapping = {}
-        for target in target_fields:
+        fuzzy_rows = []
+        for row, (target, target_lower, target_base, target_variations) in enumerate(targets_desc):
             # Try to find an exact match
-            if target in source_fields:
+            if target in name_index:
                 mapping[target] = target
                 logger.info(f"Exact match: {target}")
                 continue
             
             # Try to find a case-insensitive match
-            target_lower = target.lower()
-            exact_match_found = False
+            if target_lower in lower_index:
+                source = sources_desc[lower_index[target_lower]][0]
+                mapping[target] = source
+                logger.info(f"Case-insensitive match: {target} -> {source}")
+                continue
+            
+            logger.debug("Target variations for %s: %s", target, target_variations)
+            
+            # Rule-based matches take precedence over scoring: the first source
+            # that is a special case or a known variation of the target wins.
+            # The candidates are looked up in the source indexes instead of
+            # comparing the target against every source.
+            special_column = min(
+                (lower_index[source] for source in self.special_cases_lower.get(target_lower, ())
+                 if source in lower_index),
+                default=None
+            )
+            variation_columns = [
+                lower_index[variant] for variant in self.variations_lower.get(target_base, ())
+                if variant in lower_index
+            ]
+            variation_columns.extend(
+                base_index[main] for main in self.variation_mains.get(target_lower, ())
+                if main in base_index
+            )
+            variation_column = min(variation_columns, default=None)
             
-            for source in source_fields:
-                if target_lower == source.lower():
-                    mapping[target] = source
-                    logger.info(f"Case-insensitive match: {target} -> {source}")
-                    exact_match_found = True
-                    break
+            # Check for special case matches
+            if special_column is not None and \
+               (variation_column is None or special_column <= variation_column):
+                source = sources_desc[special_column][0]
+                mapping[target] = source
+                logger.info(f"Special case match: {target} -> {source}")
+                continue
             
-            if exact_match_found:
+            # Check for direct match with known variations
+            if variation_column is not None:
+                source = sources_desc[variation_column][0]
+                mapping[target] = source
+                logger.info(f"Direct variation match: {target} -> {source}")
                 continue
             
+            # Reserve the position of the target to keep the mapping in target order
+            mapping[target] = None
+            fuzzy_rows.append(row)
+        
+        # Score only the remaining targets against all sources at once
+        if fuzzy_rows and sources_desc:
+            scores = self._score_variations(
+                [targets_desc[row][3] for row in fuzzy_rows],
+                [desc[3] for desc in sources_desc]
+            )
+        
+        for score_row, row in enumerate(fuzzy_rows):
             # Try to match based on word variations
+            target = targets_desc[row][0]
             best_match = None
             best_score = 0
             logger.info(f"Trying to fuzzy match: {target}")
             
-            # Extract the base words from target (remove _id, _name suffixes)
-            target_base = target_lower
-            for suffix in ['_id', '_name', '_nr', '_no', '_num', '_number']:
-                if target_base.endswith(suffix):
-                    target_base = target_base[:-len(suffix)]
-                    logger.debug(f"Removed suffix from {target_lower} -> {target_base}")
-                    break
-            
-            # Check if any part of the target matches a known variation
-            target_parts = target_base.split('_')
-            target_variations = set()
-            
-            for part in target_parts:
-                # Add the original part
-                target_variations.add(part)
-                # Add any known variations (case-insensitive)
-                if part.lower() in self.variation_lookup:
-                    variation = self.variation_lookup[part.lower()]
-                    target_variations.add(variation)
-                    logger.debug(f"Found variation for '{part}': '{variation}'")
-            
-            logger.debug(f"Target variations for {target}: {target_variations}")
-            
-            for source in source_fields:
-                source_lower = source.lower()
-                source_base = source_lower
-                
-                # Extract the base words from source
-                for suffix in ['_id', '_name', '_nr', '_no', '_num', '_number']:
-                    if source_base.endswith(suffix):
-                        source_base = source_base[:-len(suffix)]
-                        logger.debug(f"Removed suffix from {source_lower} -> {source_base}")
-                        break
-                
-                # Split source into parts
-                source_parts = source_base.split('_')
-                source_variations = set()
-                
-                # Check for special case matches
-                if target_lower in self.special_cases and source in self.special_cases[target_lower]:
-                    logger.info(f"Special case match: {target} -> {source}")
-                    best_match = source
-                    best_score = 1.0
-                    break
-                
-                # Check for direct match with known variations
-                if target_base in self.variations and source.lower() in [v.lower() for v in self.variations[target_base]] or \
-                   source_base in self.variations and target.lower() in [v.lower() for v in self.variations[source_base]]:
-                    logger.info(f"Direct variation match: {target} -> {source}")
-                    best_match = source
-                    best_score = 0.9
-                    break
-                
-                for part in source_parts:
-                    # Add the original part
-                    source_variations.add(part)
-                    # Add any known variations (case-insensitive)
-                    if part.lower() in self.variation_lookup:
-                        variation = self.variation_lookup[part.lower()]
-                        source_variations.add(variation)
-                        logger.debug(f"Found source variation for '{part}': '{variation}'")
-                
-                # Calculate similarity score based on common variations
-                common_variations = target_variations.intersection(source_variations)
-                if common_variations:
-                    logger.debug(f"Common variations between {target} and {source}: {common_variations}")
-                    score = len(common_variations) / max(len(target_variations), len(source_variations))
-                    
-                    # Boost score for longer matches
-                    if len(common_variations) > 1:
-                        score *= 1.5
-                    
-                    logger.debug(f"Score for {target} -> {source}: {score:.2f}")
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_match = source
+            # Take the highest scored source, the first one wins on ties
+            if sources_desc:
+                best_column = int(scores[score_row].argmax())
+                if scores[score_row, best_column] > 0:
+                    best_match = sources_desc[best_column][0]
+                    best_score = float(scores[score_row, best_column])
+                    logger.debug("Score for %s -> %s: %.2f", target, best_match, best_score)
             
             # If we found a good match (score > 0.3), use it - lowered threshold for more matches
             if best_match and best_score > 0.3:
                 mapping[target] = best_match
                 logger.info(f"Fuzzy matched: {target} -> {best_match} (score: {best_score:.2f})")
+            else:
+                mapping.pop(target, None)
         
         logger.info(f"Auto-mapping completed with {len(mapping)} matches")
-        return mapping
+        if len(self._automap_cache) >= self.AUTOMAP_CACHE_SIZE:
+            # Drop the oldest result
+            self._automap_cache.pop(next(iter(self._automap_cache)))
+        self._automap_cache[cache_key] = mapping
+        return dict(mapping)
@@ -0,0 +1,51 @@
+"""
+Background worker for the CSV2JSON converter GUI.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.csv2json.core.logging import logger
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a worker.
+    """
+    finished = pyqtSignal(object)  # Signal emitted with the result of the task
+    error = pyqtSignal(str)  # Signal emitted with the error message if the task failed
+
+
+class Worker(QRunnable):
+    """
+    Runnable that executes a function on a QThreadPool thread.
+
+    The result is delivered through the signals of the worker, so slots
+    connected to them run on the GUI thread.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Create a worker for a function call.
+
+        Args:
+            fn (callable): Function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Execute the function and emit its result or error.
+        """
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.error(f"Error in background task: {e}", exc_info=True)
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
@@ -3,32 +3,50 @@ Main window for the CSV2JSON converter.
 """
 
 import os
-import sys
-import locale
+import re
 from pathlib import Path
 
 from PyQt6.QtWidgets import (QMainWindow, QVBoxLayout, QWidget, QFileDialog,
-                           QMessageBox, QApplication)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+                           QMessageBox)
+from PyQt6.QtCore import Qt, QThreadPool, pyqtSlot
 
 # Try to import with or without 'src' prefix
 try:
     from src.csv2json.core.logging import logger
-    from src.csv2json.core.converter import excel_to_json
     from src.csv2json.core.file_service import FileService
-    from src.csv2json.data import get_datatype_path
+    from src.csv2json.core.converter import excel_to_json, load_datatypes
+    from src.csv2json.data import resolve_datatype_path
     from src.csv2json.gui.components.toolbar import MainToolbar
     from src.csv2json.gui.components.mapping_widget import MappingWidget
     from src.csv2json.gui.components.log_viewer import LogViewer
+    from src.csv2json.gui.services.worker import Worker
+    from src.csv2json.gui.icon_utils import get_app_icon
 except ImportError:
     from csv2json.core.logging import logger
-    from csv2json.core.converter import excel_to_json
     from csv2json.core.file_service import FileService
-    from csv2json.data import get_datatype_path
+    from csv2json.core.converter import excel_to_json, load_datatypes
+    from csv2json.data import resolve_datatype_path
     from csv2json.gui.components.toolbar import MainToolbar
     from csv2json.gui.components.mapping_widget import MappingWidget
     from csv2json.gui.components.log_viewer import LogViewer
+    from csv2json.gui.services.worker import Worker
+    from csv2json.gui.icon_utils import get_app_icon
+
+# Matches file names with an Excel extension (.xlsx or .xls)
+EXCEL_FILE_PATTERN = re.compile(r'\.xlsx?\Z', re.IGNORECASE)
+
+
+def is_excel_file(file_path):
+    """
+    Check if a file path has an Excel extension.
+
+    Args:
+        file_path (str): Path to check
+
+    Returns:
+        bool: True if the path ends with .xlsx or .xls
+    """
+    return EXCEL_FILE_PATTERN.search(file_path) is not None
 
 
 class MainWindow(QMainWindow):
@@ -41,88 +59,11 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(800, 600)
         self.setAcceptDrops(True)  # Enable drops for the main window
 
-        # Determine if we're running in a PyInstaller bundle
-        def is_bundled():
-            return getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
-
-        # Set application icon - try multiple possible paths
-        icon_paths = []
-
-        if is_bundled():
-            # PyInstaller paths
-            base_path = sys._MEIPASS
-            icon_paths.extend([
-                os.path.join(base_path, "csv2json", "resources", "csv2json.ico"),
-                os.path.join(base_path, "resources", "csv2json.ico"),
-                os.path.join(base_path, "csv2json.ico"),
-                # Also check executable directory
-                os.path.join(os.path.dirname(sys.executable), "csv2json.ico"),
-            ])
-        else:
-            # Development paths
-            icon_paths.extend([
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "resources", "csv2json.ico"),
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "resources", "csv2json.ico"),
-            ])
-
-        # Common paths to try in both modes
-        icon_paths.extend([
-            os.path.join("csv2json", "resources", "csv2json.ico"),
-            os.path.join(os.path.dirname(sys.executable), "csv2json", "resources", "csv2json.ico"),
-            # Try the current directory
-            os.path.join(os.getcwd(), "csv2json.ico"),
-            os.path.join(os.getcwd(), "resources", "csv2json.ico"),
-            os.path.join(os.getcwd(), "csv2json", "resources", "csv2json.ico"),
-        ])
-
-        # Log all paths we're checking
-        logger.debug(f"Checking icon paths: {icon_paths}")
-
-        icon_set = False
-        for icon_path in icon_paths:
-            try:
-                if os.path.exists(icon_path):
-                    self.setWindowIcon(QIcon(icon_path))
-                    logger.info(f"Set application icon: {icon_path}")
-                    icon_set = True
-                    break
-            except Exception as e:
-                logger.error(f"Error setting icon from {icon_path}: {e}")
-
-        if not icon_set:
-            logger.warning("Could not find application icon")
-            # Try to create a simple icon programmatically
-            try:
-                from PyQt6.QtGui import QPixmap, QPainter, QColor, QBrush, QPen
-                from PyQt6.QtCore import QPoint
-                pixmap = QPixmap(64, 64)
-                pixmap.fill(QColor(255, 255, 255, 0))
-                painter = QPainter(pixmap)
-                painter.setBrush(QBrush(QColor(41, 128, 185)))
-                painter.setPen(QPen(QColor(41, 128, 185)))
-                painter.drawRect(5, 5, 25, 54)
-                painter.setBrush(QBrush(QColor(39, 174, 96)))
-                painter.setPen(QPen(QColor(39, 174, 96)))
-                painter.drawRect(34, 5, 25, 54)
-                painter.setBrush(QBrush(QColor(52, 73, 94)))
-                painter.setPen(QPen(QColor(52, 73, 94)))
-                painter.drawPolygon([QPoint(25, 25), QPoint(39, 15), QPoint(39, 35)])
-                painter.end()
-                self.setWindowIcon(QIcon(pixmap))
-                logger.info("Created fallback icon programmatically")
-            except Exception as e:
-                logger.error(f"Error creating fallback icon: {e}")
+        # Set application icon, created once and shared by all windows
+        self.setWindowIcon(get_app_icon())
 
         logger.info("Initializing main window")
 
-        # Set locale for number formatting
-        try:
-            locale.setlocale(locale.LC_NUMERIC, 'German_Germany.1252')
-            logger.info("Set locale to German_Germany.1252")
-        except locale.Error:
-            logger.warning("Could not set German locale, using default")
-            pass  # Use default locale if German is not available
-
         # Create toolbar with controls
         self.toolbar = MainToolbar(self)
         self.addToolBar(self.toolbar)
@@ -154,6 +95,16 @@ class MainWindow(QMainWindow):
         self.selected_file = None
         self.field_mapping = {}
 
+        # Directory the file dialog starts in
+        self.last_dir = ""
+
+        # Workers of the latest header request and conversion
+        self.headers_worker = None
+        self.conversion_worker = None
+
+        # Log viewer dialog, created on first use
+        self.log_viewer = None
+
         # Initialize button states
         self.toolbar.set_file_selected(False)
 
@@ -161,29 +112,43 @@ class MainWindow(QMainWindow):
         self.load_datatypes_for_mapping()
         logger.info("Main window initialization complete")
 
+    @pyqtSlot()
     def browse_file(self):
         """
         Open a file dialog to select an Excel file.
         """
         logger.info("Opening file dialog to browse for Excel file")
+        # Start in the directory of the last file and skip custom directory
+        # icons and symlink resolution, which are slow on network drives
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Excel File", "", "Excel Files (*.xlsx *.xls);;All Files (*)"
+            self, "Select Excel File", self.last_dir, "Excel Files (*.xlsx *.xls);;All Files (*)",
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.DontResolveSymlinks
         )
 
         if file_path:
             logger.info(f"Selected file: {file_path}")
-            self.selected_file = file_path
-            self.statusBar().showMessage(f"Selected file: {Path(file_path).name}")
-
-            # Update toolbar status label and button states
-            self.toolbar.status_label.setText(f"File: {Path(file_path).name}")
-            self.toolbar.set_file_selected(True)
-
-            # Load Excel headers for mapping
-            self.load_excel_headers(file_path, self.toolbar.skip_rows_spinner.value())
+            self.last_dir = os.path.dirname(file_path)
+            self.select_file(file_path)
         else:
             logger.info("No file selected")
 
+    def select_file(self, file_path):
+        """
+        Make a file the selected file and load its headers for mapping.
+
+        Args:
+            file_path (str): Path to the Excel file
+        """
+        self.selected_file = file_path
+        self.statusBar().showMessage(f"Selected file: {Path(file_path).name}")
+
+        # Update button states
+        self.toolbar.set_file_selected(True)
+
+        # Load Excel headers for mapping
+        self.load_excel_headers(file_path, self.toolbar.skip_rows_spinner.value())
+
+    @pyqtSlot(int)
     def on_skip_rows_changed(self, value):
         """
         Handle skip rows value change.
@@ -206,23 +171,54 @@ class MainWindow(QMainWindow):
             skiprows (int, optional): Number of rows to skip from the beginning of the file. Defaults to 0.
         """
         logger.info(f"Loading Excel headers from: {excel_path} (skipping {skiprows} rows)")
-        try:
-            # Get Excel headers
-            headers = FileService.get_excel_headers(excel_path, skiprows)
-            logger.info(f"Got {len(headers)} headers from Excel file")
+        self.statusBar().showMessage(f"Loading headers from {Path(excel_path).name}...")
+
+        # Read the workbook on a pool thread so the window stays responsive
+        self.headers_worker = Worker(FileService.get_excel_headers, excel_path, skiprows)
+        self.headers_worker.signals.finished.connect(self.on_headers_loaded)
+        self.headers_worker.signals.error.connect(self.on_headers_failed)
+        QThreadPool.globalInstance().start(self.headers_worker)
+
+    @pyqtSlot(object)
+    def on_headers_loaded(self, headers):
+        """
+        Handle Excel headers loaded by the header worker.
 
+        Args:
+            headers (list): List of column headers
+        """
+        # Ignore results of requests that were superseded by a newer one
+        if self.sender() is not self.headers_worker.signals:
+            logger.debug("Ignoring headers of an outdated request")
+            return
+
+        logger.info(f"Got {len(headers)} headers from Excel file")
+        self.statusBar().showMessage(f"Selected file: {Path(self.selected_file).name}")
+        try:
             # Load headers into the mapping widget
             self.mapping_widget.load_source_fields(headers)
             logger.debug("Loaded source fields into mapping widget")
-
-            # Update the field mapping
-            self.field_mapping = self.mapping_widget.get_mapping()
-            logger.debug(f"Updated field mapping: {self.field_mapping}")
         except Exception as e:
             logger.error(f"Error loading Excel headers: {e}", exc_info=True)
             self.statusBar().showMessage(f"Error loading Excel headers: {str(e)}")
             QMessageBox.critical(self, "Error", f"Error loading Excel headers: {str(e)}")
 
+    @pyqtSlot(str)
+    def on_headers_failed(self, message):
+        """
+        Handle errors of the header worker.
+
+        Args:
+            message (str): Error message
+        """
+        # Ignore errors of requests that were superseded by a newer one
+        if self.sender() is not self.headers_worker.signals:
+            return
+
+        self.statusBar().showMessage(f"Error loading Excel headers: {message}")
+        QMessageBox.critical(self, "Error", f"Error loading Excel headers: {message}")
+
+    @pyqtSlot(dict)
     def on_mapping_changed(self, mapping):
         """
         Handle changes to the field mapping.
@@ -231,8 +227,9 @@ class MainWindow(QMainWindow):
             mapping (dict): Updated field mapping
         """
         self.field_mapping = mapping
-        logger.debug(f"Field mapping updated: {len(mapping)} mappings")
+        logger.debug("Field mapping updated: %d mappings", len(mapping))
 
+    @pyqtSlot()
     def convert_file(self):
         """
         Convert the selected Excel file to JSON.
@@ -253,9 +250,6 @@ class MainWindow(QMainWindow):
         """
         logger.info(f"Processing Excel file: {excel_path}")
         try:
-            self.statusBar().showMessage(f"Processing {Path(excel_path).name}...")
-            QApplication.processEvents()  # Update UI
-
             # Get selected root element display name
             display_name = self.toolbar.root_combo.currentText()
 
@@ -265,10 +259,9 @@ class MainWindow(QMainWindow):
             logger.info(f"Using root element: {root} (display: {display_name}), remove_nulls: {remove_nulls}")
 
             # Get datatypes file path
-            datatypes_file = get_datatype_path(root)
-            if not os.path.exists(datatypes_file):
-                logger.warning(f"Datatypes file not found: {datatypes_file}")
-                datatypes_file = None
+            datatypes_file = resolve_datatype_path(root)
+            if datatypes_file is None:
+                logger.warning(f"Datatypes file not found for root element: {root}")
             else:
                 logger.info(f"Using datatypes file: {datatypes_file}")
 
@@ -276,41 +269,78 @@ class MainWindow(QMainWindow):
             json_path = FileService.get_output_path(excel_path)
             logger.info(f"Output JSON path: {json_path}")
 
-            # Get current field mapping
-            self.field_mapping = self.mapping_widget.get_mapping()
+            # The field mapping is kept up to date by the mapping_changed signal
             logger.info(f"Using field mapping with {len(self.field_mapping)} entries")
 
             # Get skip rows value
             skiprows = self.toolbar.skip_rows_spinner.value()
             logger.info(f"Skipping {skiprows} rows")
-
-            # Convert Excel to JSON with field mapping
-            json_path = excel_to_json(
-                excel_path,
-                root,
-                json_path,
-                remove_nulls,
-                datatypes_file,
-                self.field_mapping,
-                skiprows
-            )
-
-            logger.info(f"Conversion successful. Output file: {json_path}")
-            self.statusBar().showMessage(f"Successfully converted: {Path(excel_path).name} to {Path(json_path).name}")
-
-            # Ask if user wants to open the output file
-            reply = QMessageBox.question(self, "Conversion Complete",
-                                        f"File saved to {json_path}\n\nDo you want to open the output folder?",
-                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-            if reply == QMessageBox.StandardButton.Yes:
-                logger.info(f"Opening output folder: {os.path.dirname(json_path)}")
-                FileService.open_folder(json_path)
-
         except Exception as e:
             logger.error(f"Error processing file: {e}", exc_info=True)
             self.statusBar().showMessage(f"Error: {str(e)}")
             QMessageBox.critical(self, "Error", f"Error processing file: {str(e)}")
+            return
+
+        # Convert Excel to JSON with field mapping on a pool thread; the
+        # convert button stays disabled until the conversion has finished
+        self.statusBar().showMessage(f"Processing {Path(excel_path).name}...")
+        self.toolbar.set_conversion_running(True)
+        self.conversion_worker = Worker(
+            excel_to_json,
+            excel_path,
+            root,
+            json_path,
+            remove_nulls,
+            datatypes_file,
+            dict(self.field_mapping),
+            skiprows
+        )
+        self.conversion_worker.signals.finished.connect(self.on_conversion_finished)
+        self.conversion_worker.signals.error.connect(self.on_conversion_failed)
+        QThreadPool.globalInstance().start(self.conversion_worker)
+
+    @pyqtSlot(object)
+    def on_conversion_finished(self, json_path):
+        """
+        Handle a finished conversion.
+
+        Args:
+            json_path (str): Path to the output JSON file
+        """
+        # Ignore results of workers other than the current conversion
+        if self.sender() is not self.conversion_worker.signals:
+            return
 
+        self.toolbar.set_conversion_running(False)
+        excel_path = self.conversion_worker.args[0]
+        logger.info(f"Conversion successful. Output file: {json_path}")
+        self.statusBar().showMessage(f"Successfully converted: {Path(excel_path).name} to {Path(json_path).name}")
+
+        # Ask if user wants to open the output file
+        reply = QMessageBox.question(self, "Conversion Complete",
+                                    f"File saved to {json_path}\n\nDo you want to open the output folder?",
+                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            logger.info(f"Opening output folder: {os.path.dirname(json_path)}")
+            FileService.open_folder(json_path)
+
+    @pyqtSlot(str)
+    def on_conversion_failed(self, message):
+        """
+        Handle errors of the conversion worker.
+
+        Args:
+            message (str): Error message
+        """
+        # Ignore errors of workers other than the current conversion
+        if self.sender() is not self.conversion_worker.signals:
+            return
+
+        self.toolbar.set_conversion_running(False)
+        self.statusBar().showMessage(f"Error: {message}")
+        QMessageBox.critical(self, "Error", f"Error processing file: {message}")
+
+    @pyqtSlot(int)
     def load_datatypes_for_mapping(self, index=None):
         """
         Load datatypes for the selected root element and update the mapping widget.
@@ -330,16 +360,15 @@ class MainWindow(QMainWindow):
         logger.info(f"Loading datatypes for root element: {root} (display: {display_name})")
 
         # Get datatypes file path
-        datatypes_file = get_datatype_path(root)
-        if not os.path.exists(datatypes_file):
-            logger.warning(f"Datatypes file not found: {datatypes_file}")
+        datatypes_file = resolve_datatype_path(root)
+        if datatypes_file is None:
+            logger.warning(f"Datatypes file not found for root element: {root}")
             return
 
         # Load datatypes
         try:
-            from src.csv2json.core.converter import load_datatypes
             datatypes_str = load_datatypes(datatypes_file)
-            logger.debug(f"Loaded datatypes from: {datatypes_file}")
+            logger.debug("Loaded datatypes from: %s", datatypes_file)
 
             # Pass the raw string to the mapping widget
             self.mapping_widget.load_datatypes(datatypes_str)
@@ -347,29 +376,34 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error loading datatypes: {e}", exc_info=True)
 
+    @pyqtSlot()
     def show_log_viewer(self):
         """
         Show the log viewer dialog.
         """
         logger.info("Opening log viewer")
-        log_viewer = LogViewer(self)
-        log_viewer.exec()
+        # The dialog is created once and reloads the logs whenever it is shown
+        if self.log_viewer is None:
+            self.log_viewer = LogViewer(self)
+        self.log_viewer.exec()
         logger.info("Log viewer closed")
 
     def dragEnterEvent(self, event):
         """
         Handle drag enter events.
         """
-        if event.mimeData().hasUrls():
-            # Check if the dragged file is an Excel file
-            urls = event.mimeData().urls()
-            if urls and urls[0].toLocalFile().lower().endswith(('.xlsx', '.xls')):
-                event.acceptProposedAction()
-                logger.debug("Drag enter event accepted for Excel file")
-            else:
-                logger.debug("Drag enter event rejected (not an Excel file)")
-        else:
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
             logger.debug("Drag enter event rejected (no URLs)")
+            return
+
+        # Check if the dragged file is an Excel file
+        urls = mime_data.urls()
+        if urls and is_excel_file(urls[0].toLocalFile()):
+            event.acceptProposedAction()
+            logger.debug("Drag enter event accepted for Excel file")
+        else:
+            logger.debug("Drag enter event rejected (not an Excel file)")
 
     def dropEvent(self, event):
         """
@@ -380,17 +414,9 @@ class MainWindow(QMainWindow):
             url = event.mimeData().urls()[0]
             file_path = url.toLocalFile()
 
-            if file_path.lower().endswith(('.xlsx', '.xls')):
+            if is_excel_file(file_path):
                 logger.info(f"File dropped: {file_path}")
-                self.selected_file = file_path
-                self.statusBar().showMessage(f"Selected file: {Path(file_path).name}")
-
-                # Update button states
-                self.toolbar.set_file_selected(True)
-
-                # Load Excel headers for mapping
-                self.load_excel_headers(file_path, self.toolbar.skip_rows_spinner.value())
-
+                self.select_file(file_path)
                 event.acceptProposedAction()
             else:
                 logger.warning(f"Dropped file is not an Excel file: {file_path}")
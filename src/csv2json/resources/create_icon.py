@@ -75,24 +75,39 @@ def create_icon(size=256):
     
     return img
 
+def is_up_to_date(path):
+    """Check if a generated icon file is newer than this script."""
+    return os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(__file__)
+
 def save_icons():
-    """Create and save icons in different sizes."""
+    """Create and save icons in different sizes, skipping up-to-date files."""
     # Create resources directory if it doesn't exist
     resources_dir = os.path.dirname(os.path.abspath(__file__))
     os.makedirs(resources_dir, exist_ok=True)
     
-    # Create and save icons in different sizes
+    # Create and save icons in different sizes; the icon is drawn once at
+    # the largest size and scaled down for the smaller ones
     sizes = [16, 32, 48, 64, 128, 256]
+    largest = None
     for size in sizes:
-        icon = create_icon(size)
         icon_path = os.path.join(resources_dir, f"icon_{size}.png")
+        if is_up_to_date(icon_path):
+            print(f"Icon is up to date: {icon_path}")
+            continue
+        if largest is None:
+            largest = create_icon(max(sizes))
+        icon = largest if size == largest.width else largest.resize((size, size), Image.LANCZOS)
         icon.save(icon_path)
         print(f"Created icon: {icon_path}")
     
     # Create ICO file for Windows
-    icon = create_icon(256)
     ico_path = os.path.join(resources_dir, "csv2json.ico")
-    icon.save(ico_path, format="ICO", sizes=[(size, size) for size in sizes])
+    if is_up_to_date(ico_path):
+        print(f"ICO file is up to date: {ico_path}")
+        return
+    if largest is None:
+        largest = create_icon(max(sizes))
+    largest.save(ico_path, format="ICO", sizes=[(size, size) for size in sizes])
     print(f"Created ICO file: {ico_path}")
 
 if __name__ == "__main__":